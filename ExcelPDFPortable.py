@@ -1,15 +1,199 @@
 # ExcelPDFPortable.py
 # 스크린샷과 동일 레이아웃 + 모든 기능(시트복사/이어붙이기/통합엑셀/각종 PDF 출력) 포함
 # Windows + Microsoft Excel 권장(서식 보존 복사 & PDF 내보내기용)
-import os, sys, tempfile, shutil
+#
+# 실행 옵션
+#   --profile-startup   import/시작 구간 시간을 stderr와 %TEMP%\ExcelPDFPortable_startup.txt 에 기록
+#   --warm-excel        창 표시 후 백그라운드에서 Excel COM(렌더링 백엔드)까지 미리 준비
+#   --list-sheets 경로  Qt 없이 시트 목록만 출력(헤드리스, 콘솔 실행용)
+import os, sys, time
+_T0 = time.perf_counter()
+import tempfile, shutil
 from collections import defaultdict
-from PyQt5 import QtCore, QtGui, QtWidgets
+# 창 표시 전 경로를 가볍게 유지: threading/zipfile/xml 등은 쓰는 함수 안에서 import
 
 EXCEL_EXTS = {".xls", ".xlsx", ".xlsm", ".xlsb"}
 
 def is_excel(path: str) -> bool:
     return os.path.splitext(path)[1].lower() in EXCEL_EXTS
 
+# ------------------------ 시작 프로파일 ------------------------
+PROFILE = "--profile-startup" in sys.argv
+# dict.setdefault는 GIL 아래 원자적이라 예열 스레드에서 불러도 락이 필요 없음
+_marks = {}   # 이름 -> 스크립트 시작 후 경과(초), 처음 기록만 유지
+_spans = {}   # 이름 -> 소요 시간(초), 처음 기록만 유지
+
+def mark(name):
+    _marks.setdefault(name, time.perf_counter() - _T0)
+
+class timed:
+    """with timed("이름"): ... 구간 시간을 _spans에 기록"""
+    def __init__(self, name):
+        self.name = name
+    def __enter__(self):
+        self.t = time.perf_counter()
+    def __exit__(self, *exc):
+        _spans.setdefault(self.name, time.perf_counter() - self.t)
+
+def _process_age(pid):
+    """pid 프로세스가 생성된 뒤 지금까지 흐른 초 (모르면 None)"""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            k32 = ctypes.windll.kernel32
+            k32.OpenProcess.restype = wintypes.HANDLE
+            h = k32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+            if not h:
+                return None
+            try:
+                ft = [wintypes.FILETIME() for _ in range(4)]
+                if not k32.GetProcessTimes(wintypes.HANDLE(h), *[ctypes.byref(x) for x in ft]):
+                    return None
+            finally:
+                k32.CloseHandle(wintypes.HANDLE(h))
+            created = ((ft[0].dwHighDateTime << 32) | ft[0].dwLowDateTime) / 1e7 - 11644473600
+            return time.time() - created
+        if sys.platform.startswith("linux"):
+            with open(f"/proc/{pid}/stat") as f:
+                start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+            return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        pass
+    return None
+
+def _boot_origins():
+    """스크립트 시작(_T0)보다 앞선 기준점: [(이름, 그 시점부터 _T0까지 걸린 초)]"""
+    since_t0 = time.perf_counter() - _T0
+    pids = [("프로세스 생성", os.getpid())]
+    # onefile: 부모 프로세스가 부트로더 — 압축 해제는 그쪽에서 일어남
+    # (onedir 빌드면 _MEIPASS가 exe 폴더나 그 아래 _internal이라 제외)
+    meipass = getattr(sys, "_MEIPASS", None)
+    exe_dir = os.path.dirname(os.path.abspath(sys.executable))
+    if meipass and os.path.abspath(meipass) not in (exe_dir, os.path.join(exe_dir, "_internal")):
+        pids.append(("onefile 부트로더 시작", os.getppid()))
+    origins = []
+    for name, pid in pids:
+        age = _process_age(pid)
+        if age is not None:
+            origins.append((name, age - since_t0))
+    return origins
+
+def report_profile():
+    if not PROFILE:
+        return
+    origins = _boot_origins()
+    head = "".join(f"  {n+' 기준':>14}" for n, _ in origins)
+    lines = [f"[startup profile] 시점(ms)  {'스크립트 시작 기준':>14}{head}"]
+    for k, v in sorted(list(_marks.items()), key=lambda kv: kv[1]):
+        cols = "".join(f"  {(v+off)*1000:14.1f}" for _, off in origins)
+        lines.append(f"  {v*1000:24.1f}{cols}  {k}")
+    lines.append("[startup profile] 구간(ms)")
+    lines += [f"  {v*1000:9.1f}  {k}" for k, v in list(_spans.items())]
+    text = "\n".join(lines)
+    # --windowed 빌드는 stderr가 None이라 파일로도 남김
+    if sys.stderr:
+        print(text, file=sys.stderr)
+    try:
+        with open(os.path.join(tempfile.gettempdir(), "ExcelPDFPortable_startup.txt"), "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    except Exception:
+        pass
+
+# ------------------------ 시트 목록 (Qt 불필요) ------------------------
+def _xlsx_sheet_names(path):
+    """xl/workbook.xml 의 <sheets>만 읽음 — openpyxl import/워크북 파싱 없이 빠름"""
+    import zipfile
+    from xml.etree import ElementTree
+    names = []
+    with zipfile.ZipFile(path) as z, z.open("xl/workbook.xml") as f:
+        for _, el in ElementTree.iterparse(f):
+            tag = el.tag.rsplit("}", 1)[-1]
+            if tag == "sheet":
+                names.append(el.get("name"))
+            elif tag == "sheets":
+                break
+    return names
+
+def list_sheet_names(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        import zipfile
+        from xml.etree import ElementTree
+        try:
+            return _xlsx_sheet_names(path)
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            pass  # 비표준 구조면 openpyxl로
+    if ext in (".xlsx", ".xlsm", ".xlsb"):
+        from openpyxl import load_workbook
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+    if ext == ".xls":
+        import xlrd
+        wb = xlrd.open_workbook(path, on_demand=True)
+        try:
+            return wb.sheet_names()
+        finally:
+            wb.release_resources()
+    return []
+
+# ------------------------ 백그라운드 예열 ------------------------
+def warm_readers():
+    """시트/데이터 읽기 라이브러리를 미리 import (첫 '시트 목록 불러오기' 지연 제거)"""
+    try:
+        with timed("import openpyxl (예열)"):
+            import openpyxl
+        with timed("import xlrd (예열)"):
+            import xlrd
+    except Exception:
+        pass
+    mark("리더 예열 완료")
+
+def warm_excel():
+    """Excel COM 형식 라이브러리(gencache) 생성 + Excel 실행 파일을 디스크 캐시에 올려둠"""
+    try:
+        with timed("Excel COM 예열"):
+            import pythoncom
+            import win32com.client as win32
+            pythoncom.CoInitialize()
+            try:
+                xl = win32.gencache.EnsureDispatch("Excel.Application")
+                try:
+                    xl.DisplayAlerts = False
+                finally:
+                    try:
+                        xl.Quit()
+                    finally:
+                        del xl  # CoUninitialize 전에 프록시를 Release해야 EXCEL.EXE가 종료됨
+            finally:
+                pythoncom.CoFreeUnusedLibraries()
+                pythoncom.CoUninitialize()
+    except Exception:
+        pass
+    finally:
+        _excel_warm_done.set()
+    mark("Excel 예열 완료")
+
+_excel_warm_done = None   # --warm-excel일 때만 생성되는 threading.Event
+EXCEL_WARM_WAIT = 5       # ExcelCom이 예열 종료를 기다리는 최대 초 (GUI 스레드라 짧게)
+
+def start_warmup(with_excel=False):
+    global _excel_warm_done
+    import threading
+    threading.Thread(target=warm_readers, name="warmup-readers", daemon=True).start()
+    if with_excel:
+        # 별도 스레드: ExcelCom은 리더 import가 아니라 Excel 예열만 기다림
+        _excel_warm_done = threading.Event()
+        threading.Thread(target=warm_excel, name="warmup-excel", daemon=True).start()
+
+def excel_warm_ready():
+    """Excel 예열이 없거나 끝났으면 True. 예열과 gencache.EnsureDispatch가 겹치면
+    gen_py 캐시가 깨지고 Excel도 두 개 뜨므로, 그 구간만 제한 시간 동안 기다림"""
+    return _excel_warm_done is None or _excel_warm_done.wait(EXCEL_WARM_WAIT)
+
 # ------------------------ Excel COM (서식 보존 & PDF) ------------------------
 class ExcelCom:
     def __init__(self):
@@ -21,7 +205,11 @@ class ExcelCom:
         try:
             import win32com.client as win32
             self.win32 = win32
-            self.excel = win32.gencache.EnsureDispatch("Excel.Application")
+            if excel_warm_ready():
+                self.excel = win32.gencache.EnsureDispatch("Excel.Application")
+            else:
+                # 예열이 Excel 시작에서 멈춰 있음 — gen_py를 건드리지 않는 Dispatch로 진행
+                self.excel = win32.Dispatch("Excel.Application")
             self.excel.Visible = False
             self.excel.DisplayAlerts = False
             return True
@@ -101,6 +289,41 @@ class ExcelCom:
             if src_wb:
                 src_wb.Close(SaveChanges=False)
 
+# ------------------------ 헤드리스 (Qt import 없음) ------------------------
+def run_headless(argv):
+    """--list-sheets 뒤의 파일/폴더에서 '파일명 | 시트명'을 한 줄씩 출력"""
+    args = [a for a in argv[argv.index("--list-sheets")+1:] if not a.startswith("--")]
+    paths = []
+    for p in args:
+        if os.path.isdir(p):
+            for r, _, fs in os.walk(p):
+                paths += [os.path.join(r, f) for f in fs if is_excel(f)]
+        elif is_excel(p):
+            paths.append(p)
+    if not paths:
+        print("엑셀 파일을 지정하세요: --list-sheets 파일/폴더 ...", file=sys.stderr)
+        return 2
+    rc = 0
+    with timed("시트 목록 불러오기"):
+        for p in sorted(paths):
+            try:
+                for s in list_sheet_names(p):
+                    print(f"{os.path.basename(p)} | {s}")
+            except Exception as e:
+                print("시트 로드 오류:", p, e, file=sys.stderr)
+                rc = 1
+    mark("시트 목록 완료")
+    report_profile()
+    return rc
+
+if __name__ == "__main__" and "--list-sheets" in sys.argv:
+    sys.exit(run_headless(sys.argv))
+
+mark("Qt import 시작")
+with timed("import PyQt5"):
+    from PyQt5 import QtCore, QtGui, QtWidgets
+mark("Qt import 완료")
+
 # ------------------------ 파일 리스트 위젯 ------------------------
 class FileList(QtWidgets.QListWidget):
     filesChanged = QtCore.pyqtSignal()
@@ -298,21 +521,14 @@ class Main(QtWidgets.QWidget):
             self.warn("먼저 엑셀 파일을 추가하세요.")
             return
         count = 0
-        for p in paths:
-            ext = os.path.splitext(p)[1].lower()
-            try:
-                if ext in (".xlsx", ".xlsm", ".xlsb"):
-                    from openpyxl import load_workbook
-                    wb = load_workbook(p, read_only=True, data_only=True)
-                    for s in wb.sheetnames:
-                        self._add_sheet_left(f"{os.path.basename(p)} | {s}", p, s); count += 1
-                elif ext == ".xls":
-                    import xlrd
-                    wb = xlrd.open_workbook(p)
-                    for s in wb.sheet_names():
+        with timed("시트 목록 불러오기(첫 회)"):
+            for p in paths:
+                try:
+                    for s in list_sheet_names(p):
                         self._add_sheet_left(f"{os.path.basename(p)} | {s}", p, s); count += 1
-            except Exception as e:
-                print("시트 로드 오류:", p, e)
+                except Exception as e:
+                    print("시트 로드 오류:", p, e)
+        mark("첫 시트 목록 완료")
         self.info(f"시트 {count}개를 불러왔습니다.")
 
     def _add_sheet_left(self, label, file_path, sheet_name):
@@ -485,11 +701,11 @@ class Main(QtWidgets.QWidget):
                     for fp, sns in file_groups.items():
                         names_in_merged = []
                         for sn in sns:
-                            nm = f\"{os.path.splitext(os.path.basename(fp))[0]}_{sn}\"[:31]
+                            nm = f"{os.path.splitext(os.path.basename(fp))[0]}_{sn}"[:31]
                             names_in_merged.append(nm)
                         # 안전한 출력명
                         base = os.path.splitext(os.path.basename(fp))[0]
-                        out = os.path.join(self.pdf_base_dir, f\"{base}.pdf\")
+                        out = os.path.join(self.pdf_base_dir, f"{base}.pdf")
                         wb.Worksheets(names_in_merged[0]).Select(False)
                         for n in names_in_merged[1:]:
                             wb.Worksheets(n).Select(True)
@@ -555,7 +771,7 @@ class Main(QtWidgets.QWidget):
                 fp, sn = it.data(QtCore.Qt.UserRole)
                 com.copy_sheet_to(fp, sn, dst)
                 try:
-                    dst.Worksheets(dst.Worksheets.Count).Name = f\"{os.path.splitext(os.path.basename(fp))[0]}_{sn}\"[:31]
+                    dst.Worksheets(dst.Worksheets.Count).Name = f"{os.path.splitext(os.path.basename(fp))[0]}_{sn}"[:31]
                 except Exception:
                     pass
             com.save_wb_as(dst, save_path)
@@ -657,7 +873,16 @@ class Main(QtWidgets.QWidget):
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
-    w = Main(); w.show()
+    with timed("메인 창 생성"):
+        w = Main()
+    w.show()
+
+    def ready():
+        # 이벤트 루프 첫 회전 = 창이 입력을 받을 수 있는 시점
+        mark("창 표시(입력 가능)")
+        start_warmup(with_excel="--warm-excel" in sys.argv)
+    QtCore.QTimer.singleShot(0, ready)
+    app.aboutToQuit.connect(report_profile)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":